@@ -1,12 +1,81 @@
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum, auto
-import cloudscraper
+from array import array
+from collections import OrderedDict
+import asyncio
+from functools import lru_cache
+import hashlib
+import math
+import os
 import random
-from http import HTTPStatus
+import socket
+import sqlite3
+import threading
+import time
+import urllib.parse
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, preferring orjson's C encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Query-string spellings of the enhance flag, so the hot path does a dict
+# lookup instead of str(bool).lower() per request.
+_BOOL_STR = {True: "true", False: "false"}
+
+# Hosts the client talks to; only these get cached DNS resolution so the
+# patch below cannot serve stale records for unrelated traffic.
+_API_HOSTS = frozenset({"text.pollinations.ai", "pollinations.ai"})
+_DNS_TTL = 300.0
+_dns_cache: Dict[tuple, tuple] = {}
+_getaddrinfo_orig = None
+_dns_patch_lock = threading.Lock()
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """getaddrinfo wrapper that caches lookups for the API hosts."""
+    if host not in _API_HOSTS:
+        return _getaddrinfo_orig(host, port, family, type, proto, flags)
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    entry = _dns_cache.get(key)
+    if entry is not None and now - entry[0] < _DNS_TTL:
+        return entry[1]
+    result = _getaddrinfo_orig(host, port, family, type, proto, flags)
+    _dns_cache[key] = (now, result)
+    return result
+
+def _install_dns_cache() -> None:
+    """Patch socket.getaddrinfo with the API-host cache, once."""
+    global _getaddrinfo_orig
+    # Locked check-then-set: a racing second installer would capture the
+    # already-patched function as the "original" and recurse forever.
+    with _dns_patch_lock:
+        if _getaddrinfo_orig is None:
+            _getaddrinfo_orig = socket.getaddrinfo
+            socket.getaddrinfo = _cached_getaddrinfo
+
+# Stringified two-digit seeds, built once so the hot path avoids an
+# int-to-str conversion and randint's bias-corrected sampling per request.
+_SEEDS = tuple(str(i) for i in range(10, 100))
+
+def _random_seed() -> str:
+    """Pick a random pre-stringified two-digit seed."""
+    return _SEEDS[random.getrandbits(7) % len(_SEEDS)]
+
+@lru_cache(maxsize=1024)
+def _quote_prompt(prompt: str) -> str:
+    """Percent-encode a prompt for use in a URL path, cached per prompt."""
+    return urllib.parse.quote(prompt, safe='')
+
 class PollinationsError(Exception):
     """Base exception class for Pollinations AI related errors."""
     pass
@@ -22,6 +91,19 @@ class ValidationError(PollinationsError):
     """Exception raised for input validation errors."""
     pass
 
+def _require_nonempty_str(name: str, value: Any) -> None:
+    """
+    Validate that a value is a non-empty, non-whitespace string.
+
+    Unlike assert, this survives ``python -O`` and short-circuits before
+    allocating a stripped copy when the string is empty.
+
+    Raises:
+        ValidationError: If the value is not a non-empty string
+    """
+    if type(value) is not str or not value or not value.strip():
+        raise ValidationError(f"{name} must be a non-empty string")
+
 class ModelType(Enum):
     """Enumeration of available AI models."""
     FLUX = "flux"
@@ -34,16 +116,25 @@ class ModelType(Enum):
     @classmethod
     def get_display_name(cls, model: 'ModelType') -> str:
         """Convert enum value to display name."""
-        return {
-            cls.FLUX: "Flux",
-            cls.FLUX_REALISM: "Flux Realism",
-            cls.ANY_DARK: "Any Dark",
-            cls.FLUX_ANIME: "Flux Anime",
-            cls.FLUX_3D: "Flux 3D",
-            cls.TURBO: "Turbo"
-        }[model]
-
-@dataclass
+        return cls._DISPLAY[model]
+
+    @property
+    def display_name(self) -> str:
+        """Display name for this model."""
+        return self._DISPLAY[self]
+
+# Built once after the enum body so the members exist; a dict literal in
+# get_display_name would be reallocated on every call.
+ModelType._DISPLAY = {
+    ModelType.FLUX: "Flux",
+    ModelType.FLUX_REALISM: "Flux Realism",
+    ModelType.ANY_DARK: "Any Dark",
+    ModelType.FLUX_ANIME: "Flux Anime",
+    ModelType.FLUX_3D: "Flux 3D",
+    ModelType.TURBO: "Turbo"
+}
+
+@dataclass(frozen=True, slots=True)
 class RequestHeaders:
     """Data class for common request headers."""
     accept: str
@@ -61,20 +152,109 @@ class RequestHeaders:
 
     def to_dict(self) -> Dict[str, str]:
         """Convert headers to dictionary format."""
-        # Filter out None values and convert to dict
-        return {k.replace('_', '-'): v for k, v in self.__dict__.items() if v is not None}
+        # Filter out None values; field names were hyphenated once below
+        return {h: v for a, h in _HEADER_FIELDS if (v := getattr(self, a)) is not None}
+
+# Hyphenated header names computed once instead of str.replace per field
+# per call; slots=True above makes the getattr a C-level slot load.
+_HEADER_FIELDS = tuple(
+    (f.name, f.name.replace('_', '-')) for f in fields(RequestHeaders)
+)
+
+# Header sets are static per endpoint, so build the dicts once at import
+# instead of instantiating RequestHeaders on every request.
+_CHAT_HEADERS = RequestHeaders(
+    accept="*/*",
+    content_type="application/json",
+    origin="https://karma.pollinations.ai",
+    priority="u=1, i"
+).to_dict()
+
+_IMAGE_HEADERS = RequestHeaders(
+    accept="image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+    priority="i"
+).to_dict()
 
 class BaseClient(ABC):
     """Abstract base class for API clients."""
-    
-    def __init__(self, timeout: int = 10):
+
+    # Shared scraper so every client reuses the same keep-alive connection
+    # pool (one TLS handshake per host instead of one per call).
+    _scraper = None
+    _scraper_lock = threading.Lock()
+
+    @classmethod
+    def _get_scraper(cls):
+        """
+        Return the shared cloudscraper session, creating it on first use.
+
+        Returns:
+            cloudscraper.CloudScraper: Session with a keep-alive connection pool.
+        """
+        if BaseClient._scraper is not None:
+            return BaseClient._scraper
+        with BaseClient._scraper_lock:
+            if BaseClient._scraper is not None:
+                return BaseClient._scraper
+            # Imported here rather than at module level: cloudscraper pulls
+            # in requests, urllib3, ssl and a JS parser, which would tax
+            # callers who only want ModelType or the exception types.
+            import cloudscraper
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # cloudscraper rides on requests and therefore speaks HTTP/1.1
+            # only; an HTTP/2 client (httpx) would lose the Cloudflare
+            # challenge solving these endpoints require. Keep-alive pooling
+            # below amortizes the TLS handshakes HTTP/2 would have saved.
+            scraper = cloudscraper.create_scraper()
+            # Retry transient failures at the transport layer, where the
+            # same keep-alive connection can be reused, instead of making
+            # callers re-run a whole (possibly expensive) request.
+            retries = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=True,
+                # Hand the final 429/5xx back instead of raising
+                # MaxRetryError, so validate_response can raise APIError
+                # as the docstrings promise.
+                raise_on_status=False
+            )
+            scraper.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=8,
+                    pool_maxsize=64,
+                    pool_block=False,
+                    max_retries=retries
+                )
+            )
+            _install_dns_cache()
+            # Warm the cache so the first request skips getaddrinfo too.
+            for host in _API_HOSTS:
+                try:
+                    socket.getaddrinfo(host, 443)
+                except OSError:
+                    pass
+            scraper.headers.update({
+                "user-agent": _CHAT_HEADERS["user-agent"],
+                "sec-ch-ua": _CHAT_HEADERS["sec-ch-ua"],
+            })
+            BaseClient._scraper = scraper
+            return BaseClient._scraper
+
+    def __init__(self, timeout: int = 10, scraper: Optional[Any] = None):
         """
         Initialize the base client.
-        
+
         Args:
             timeout (int): Request timeout in seconds. Defaults to 10.
+            scraper: Optional cloudscraper session to reuse. Defaults to the
+                shared session so all clients pool connections.
         """
-        self.scraper = cloudscraper.create_scraper()
+        self.scraper = scraper if scraper is not None else self._get_scraper()
         self.timeout = timeout
 
     @abstractmethod
@@ -90,87 +270,367 @@ class BaseClient(ABC):
         """
         pass
 
+class SemanticCache:
+    """
+    Similarity-based response cache backed by sqlite3.
+
+    Unlike the exact-match cache, this also serves paraphrased prompts:
+    the user prompt is embedded, compared against stored embeddings by
+    cosine similarity, and the cached response is returned when the best
+    match clears the threshold. Entries are namespaced by a hash of the
+    system prompt so different personas never share answers.
+    """
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        threshold: float = 0.90,
+        ttl: float = 3600.0,
+        embed_fn: Optional[Callable[[str], List[float]]] = None
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            db_path (str): SQLite database file. Defaults to in-memory.
+            threshold (float): Minimum cosine similarity for a hit.
+            ttl (float): Entry lifetime in seconds.
+            embed_fn: Callable mapping a prompt to an embedding vector.
+                Defaults to sentence-transformers/all-MiniLM-L6-v2 if the
+                sentence-transformers package is installed.
+
+        Raises:
+            PollinationsError: If no embed_fn is given and
+                sentence-transformers is not installed.
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self._embed_fn = embed_fn if embed_fn is not None else self._default_embed_fn()
+        # chat_async runs lookups from worker threads, so the connection
+        # must allow cross-thread use; the lock serializes all access.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_cache ("
+                "namespace TEXT, embedding BLOB, response TEXT, created REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_semantic_cache_ns "
+                "ON semantic_cache (namespace)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _default_embed_fn() -> Callable[[str], List[float]]:
+        """Build an embedding function from sentence-transformers."""
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise PollinationsError(
+                "SemanticCache requires an embed_fn or the "
+                "sentence-transformers package"
+            )
+        model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        return lambda text: model.encode(text).tolist()
+
+    @staticmethod
+    def _namespace(system_prompt: str) -> str:
+        """Hash the system prompt into a cache namespace."""
+        return hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _cosine(a: List[float], b: array) -> float:
+        """Cosine similarity between two vectors."""
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
+
+    def lookup(self, prompt: str, system_prompt: str) -> Optional[str]:
+        """
+        Return the cached response most similar to the prompt, if any.
+
+        Args:
+            prompt (str): User prompt to match
+            system_prompt (str): System prompt defining the namespace
+
+        Returns:
+            Optional[str]: Cached response, or None on a miss
+        """
+        namespace = self._namespace(system_prompt)
+        cutoff = time.time() - self.ttl
+        query = self._embed_fn(prompt)
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM semantic_cache WHERE created < ?", (cutoff,)
+            )
+            rows = self._conn.execute(
+                "SELECT embedding, response FROM semantic_cache WHERE namespace = ?",
+                (namespace,)
+            ).fetchall()
+        best_score, best_response = 0.0, None
+        for blob, response in rows:
+            stored = array('f')
+            stored.frombytes(blob)
+            score = self._cosine(query, stored)
+            if score > best_score:
+                best_score, best_response = score, response
+        if best_score >= self.threshold:
+            return best_response
+        return None
+
+    def insert(self, prompt: str, system_prompt: str, response: str) -> None:
+        """
+        Store a response under the prompt's embedding.
+
+        Args:
+            prompt (str): User prompt that produced the response
+            system_prompt (str): System prompt defining the namespace
+            response (str): API response to cache
+        """
+        embedding = array('f', self._embed_fn(prompt))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO semantic_cache VALUES (?, ?, ?, ?)",
+                (self._namespace(system_prompt), embedding.tobytes(),
+                 response, time.time())
+            )
+            self._conn.commit()
+
 class ChatClient(BaseClient):
     """Client for interacting with Pollinations AI chat API."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        scraper: Optional[Any] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         Initialize the chat client.
-        
+
         Args:
             timeout (int): Request timeout in seconds. Defaults to 10.
+            scraper: Optional cloudscraper session to reuse.
+            semantic_cache (Optional[SemanticCache]): Optional similarity
+                cache consulted after an exact-match miss.
         """
-        super().__init__(timeout)
+        super().__init__(timeout, scraper)
         self.base_url = "https://text.pollinations.ai/"
+        self.semantic_cache = semantic_cache
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_maxsize = 512
+        self._cache_ttl = 300.0
+        # chat_async runs chat() on worker threads; the OrderedDict's
+        # del/move_to_end/popitem sequences race without a lock.
+        self._cache_lock = threading.Lock()
+        # Request-body skeleton specialized at construction; chat() only
+        # fills in the varying slots under the lock before serializing.
+        self._system_msg: Dict[str, str] = {"role": "system", "content": ""}
+        self._user_msg: Dict[str, str] = {"role": "user", "content": ""}
+        self._body_template: Dict[str, Any] = {
+            "messages": [self._system_msg, self._user_msg],
+            "jsonMode": True
+        }
+        self._body_lock = threading.Lock()
+
+    def _build_body(self, prompt: str, system_prompt: str, seed: Optional[int]) -> bytes:
+        """Serialize a request body from the prebuilt skeleton."""
+        with self._body_lock:
+            self._system_msg["content"] = system_prompt
+            self._user_msg["content"] = prompt
+            if seed is not None:
+                self._body_template["seed"] = str(seed)
+            else:
+                self._body_template.pop("seed", None)
+            return _json_dumps(self._body_template)
+
+    @staticmethod
+    def _cache_key(prompt: str, system_prompt: str) -> str:
+        """Build a cache key from the prompt pair."""
+        payload = system_prompt.encode('utf-8') + b"\0" + prompt.encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response if present and not expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            timestamp, response = entry
+            if time.monotonic() - timestamp > self._cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return response
+
+    def _cache_put(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), response)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
 
     def validate_response(self, response: Any) -> None:
         """Validate chat API response."""
-        if response.status_code != HTTPStatus.OK:
+        if response.status_code != 200:
             raise APIError(response.status_code, response.text)
 
-    def chat(self, prompt: str, system_prompt: str = "You are a helpful assistant.") -> str:
+    def chat(
+        self,
+        prompt: str,
+        system_prompt: str = "You are a helpful assistant.",
+        seed: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> str:
         """
         Send a chat request to the API.
-        
+
         Args:
             prompt (str): User's input prompt
             system_prompt (str): System prompt to guide the AI's behavior
-            
+            seed (Optional[int]): Optional generation seed. Seeded requests
+                always hit the API since they are meant to vary.
+            bypass_cache (bool): Skip the response cache for this call
+
         Returns:
             str: AI's response
-            
+
         Raises:
             APIError: If the API request fails
             ValidationError: If input validation fails
         """
-        assert isinstance(prompt, str) and prompt.strip(), "Prompt must be a non-empty string"
-        assert isinstance(system_prompt, str), "System prompt must be a string"
-
-        headers = RequestHeaders(
-            accept="*/*",
-            content_type="application/json",
-            origin="https://karma.pollinations.ai",
-            priority="u=1, i"
-        ).to_dict()
-
-        json_data = {
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            "jsonMode": True,
-            "seed": str(random.randint(10, 99))
-        }
+        _require_nonempty_str("Prompt", prompt)
+        if type(system_prompt) is not str:
+            raise ValidationError("System prompt must be a string")
+
+        use_cache = not bypass_cache and seed is None
+        if use_cache:
+            key = self._cache_key(prompt, system_prompt)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+            if self.semantic_cache is not None:
+                cached = self.semantic_cache.lookup(prompt, system_prompt)
+                if cached is not None:
+                    return cached
 
         response = self.scraper.post(
             self.base_url,
-            headers=headers,
-            json=json_data,
+            headers=_CHAT_HEADERS,
+            data=self._build_body(prompt, system_prompt, seed),
             timeout=self.timeout
         )
-        
+
         self.validate_response(response)
-        return response.content.decode('utf-8')
+        result = response.content.decode('utf-8', errors='replace')
+        if use_cache:
+            self._cache_put(key, result)
+            if self.semantic_cache is not None:
+                self.semantic_cache.insert(prompt, system_prompt, result)
+        return result
+
+    async def chat_async(
+        self,
+        prompt: str,
+        system_prompt: str = "You are a helpful assistant.",
+        seed: Optional[int] = None,
+        bypass_cache: bool = False
+    ) -> str:
+        """
+        Async variant of chat(); runs the blocking call in a worker thread.
+
+        Args:
+            prompt (str): User's input prompt
+            system_prompt (str): System prompt to guide the AI's behavior
+            seed (Optional[int]): Optional generation seed
+            bypass_cache (bool): Skip the response cache for this call
+
+        Returns:
+            str: AI's response
+
+        Raises:
+            APIError: If the API request fails
+            ValidationError: If input validation fails
+        """
+        return await asyncio.to_thread(
+            self.chat, prompt, system_prompt, seed, bypass_cache
+        )
 
 class ImageClient(BaseClient):
     """Client for interacting with Pollinations AI image generation API."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        scraper: Optional[Any] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize the image generation client.
-        
+
         Args:
             timeout (int): Request timeout in seconds. Defaults to 10.
+            scraper: Optional cloudscraper session to reuse.
+            cache_dir (Optional[str]): Directory for content-addressed
+                image dedup. When set, identical images are hardlinked
+                instead of stored twice.
         """
-        super().__init__(timeout)
+        super().__init__(timeout, scraper)
         self.base_url = "https://pollinations.ai/p/"
+        self.cache_dir = cache_dir
+        # Fixed query parameters baked in once; generate_image copies this
+        # and overwrites only the varying slots.
+        self._params_template: Dict[str, Any] = {
+            "width": 1024,
+            "height": 1024,
+            "model": ModelType.FLUX_3D.value,
+            "seed": "10",
+            "nologo": "true",
+            "enhance": "true",
+        }
+
+    def _dedup_image(self, image_path: str, digest: str) -> None:
+        """
+        Hardlink image_path against the content-addressed cache.
+
+        If an image with the same SHA-256 digest was saved before, the
+        fresh copy is replaced with a hardlink to it; otherwise the new
+        file is registered in the cache. Failures (e.g. a filesystem
+        without hardlinks) silently fall back to the plain copy.
+
+        Args:
+            image_path (str): Path of the freshly written image
+            digest (str): SHA-256 hex digest of its contents
+        """
+        cached = os.path.join(self.cache_dir, f"{digest}.png")
+        try:
+            if os.path.exists(cached):
+                # Link to a temporary name and atomically replace, so the
+                # fresh download is never removed before its stand-in
+                # exists (a direct remove-then-link would lose the image
+                # if the link failed, e.g. across filesystems).
+                tmp_path = f"{image_path}.{os.getpid()}.dedup"
+                os.link(cached, tmp_path)
+                try:
+                    os.replace(tmp_path, image_path)
+                except OSError:
+                    os.remove(tmp_path)
+                    raise
+            else:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                os.link(image_path, cached)
+        except OSError:
+            pass
 
     def validate_response(self, response: Any) -> None:
         """Validate image API response."""
-        if response.status_code != HTTPStatus.OK:
+        # Only the status is checked here; touching response.content would
+        # buffer the whole body and defeat streaming. Emptiness is checked
+        # after the body has been written to disk.
+        if response.status_code != 200:
             raise APIError(response.status_code, response.text)
-        if not response.content:
-            raise APIError(response.status_code, "Empty response received")
 
     def generate_image(
         self,
@@ -199,52 +659,192 @@ class ImageClient(BaseClient):
             APIError: If the API request fails
             ValidationError: If input validation fails
         """
-        assert isinstance(prompt, str) and prompt.strip(), "Prompt must be a non-empty string"
-        assert isinstance(model, ModelType), "Model must be a ModelType enum"
-        assert isinstance(width, int) and width > 0, "Width must be a positive integer"
-        assert isinstance(height, int) and height > 0, "Height must be a positive integer"
-        assert isinstance(enhance, bool), "Enhance must be a boolean"
-
-        headers = RequestHeaders(
-            accept="image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-            priority="i"
-        ).to_dict()
-
-        params = {
-            "width": width,
-            "height": height,
-            "model": model.value,
-            "seed": str(random.randint(10, 99)),
-            "nologo": "true",
-            "enhance": str(enhance).lower(),
-        }
+        _require_nonempty_str("Prompt", prompt)
+        if type(model) is not ModelType:
+            raise ValidationError("Model must be a ModelType enum")
+        if type(width) is not int or width <= 0:
+            raise ValidationError("Width must be a positive integer")
+        if type(height) is not int or height <= 0:
+            raise ValidationError("Height must be a positive integer")
+        if type(enhance) is not bool:
+            raise ValidationError("Enhance must be a boolean")
+
+        params = self._params_template.copy()
+        params["width"] = width
+        params["height"] = height
+        params["model"] = model.value
+        params["seed"] = _random_seed()
+        params["enhance"] = _BOOL_STR[enhance]
 
         response = self.scraper.get(
-            f"{self.base_url}{prompt.replace(' ', '%20')}",
-            headers=headers,
+            f"{self.base_url}{_quote_prompt(prompt)}",
+            headers=_IMAGE_HEADERS,
             params=params,
-            timeout=self.timeout
+            timeout=self.timeout,
+            stream=True
         )
-        
+
         self.validate_response(response)
-        
-        with open(image_path, 'wb') as f:
-            f.write(response.content)
-        
+
+        # Download to a temp file and atomically replace the target. Writing
+        # image_path directly would truncate its inode in place, and after a
+        # dedup registration that inode is shared with the cache entry —
+        # the cache file would silently end up holding the new image's bytes.
+        tmp_path = f"{image_path}.{os.getpid()}.part"
+        bytes_written = 0
+        hasher = hashlib.sha256()
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+                    hasher.update(chunk)
+                    bytes_written += len(chunk)
+
+            if not bytes_written:
+                raise APIError(response.status_code, "Empty response received")
+        except BaseException:
+            # A dropped connection, timeout or empty body must not leave a
+            # partial file behind; whatever was at image_path is untouched.
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        os.replace(tmp_path, image_path)
+
+        if self.cache_dir is not None:
+            self._dedup_image(image_path, hasher.hexdigest())
+
         return f"Image successfully saved to {image_path}"
 
+    async def generate_image_async(
+        self,
+        prompt: str,
+        model: ModelType = ModelType.FLUX_3D,
+        image_path: str = "image.png",
+        width: int = 1024,
+        height: int = 1024,
+        enhance: bool = True
+    ) -> str:
+        """
+        Async variant of generate_image(); runs the blocking call in a
+        worker thread so callers can overlap several generations, e.g.
+        ``await asyncio.gather(*[client.generate_image_async(p) for p in prompts])``.
+
+        Args:
+            prompt (str): Description of the image to generate
+            model (ModelType): AI model to use for generation
+            image_path (str): Path to save the generated image
+            width (int): Image width in pixels
+            height (int): Image height in pixels
+            enhance (bool): Whether to enhance the image
+
+        Returns:
+            str: Success message with save location
+
+        Raises:
+            APIError: If the API request fails
+            ValidationError: If input validation fails
+        """
+        return await asyncio.to_thread(
+            self.generate_image, prompt, model, image_path, width, height, enhance
+        )
+
+    async def generate_images_async(
+        self,
+        prompts: List[str],
+        model: ModelType = ModelType.FLUX_3D,
+        image_paths: Optional[List[str]] = None,
+        width: int = 1024,
+        height: int = 1024,
+        enhance: bool = True,
+        max_concurrency: int = 4
+    ) -> List[str]:
+        """
+        Generate several images concurrently, streaming each to disk.
+
+        Generations are independent and network-bound, so running them in
+        parallel scales roughly linearly up to the connection-pool limit.
+
+        Args:
+            prompts (List[str]): Descriptions of the images to generate
+            model (ModelType): AI model to use for generation
+            image_paths (Optional[List[str]]): Save path per prompt.
+                Defaults to image_0.png, image_1.png, ...
+            width (int): Image width in pixels
+            height (int): Image height in pixels
+            enhance (bool): Whether to enhance the images
+            max_concurrency (int): Maximum number of in-flight requests
+
+        Returns:
+            List[str]: Success message per prompt, in input order
+
+        Raises:
+            APIError: If any API request fails
+            ValidationError: If input validation fails
+        """
+        if image_paths is None:
+            image_paths = [f"image_{i}.png" for i in range(len(prompts))]
+        if len(image_paths) != len(prompts):
+            raise ValidationError("image_paths must match prompts in length")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str, path: str) -> str:
+            async with semaphore:
+                return await self.generate_image_async(
+                    prompt, model, path, width, height, enhance
+                )
+
+        return await asyncio.gather(
+            *[_one(p, path) for p, path in zip(prompts, image_paths)]
+        )
+
+    def generate_images(
+        self,
+        prompts: List[str],
+        model: ModelType = ModelType.FLUX_3D,
+        image_paths: Optional[List[str]] = None,
+        width: int = 1024,
+        height: int = 1024,
+        enhance: bool = True,
+        max_concurrency: int = 4
+    ) -> List[str]:
+        """
+        Blocking wrapper around generate_images_async().
+
+        Args:
+            prompts (List[str]): Descriptions of the images to generate
+            model (ModelType): AI model to use for generation
+            image_paths (Optional[List[str]]): Save path per prompt
+            width (int): Image width in pixels
+            height (int): Image height in pixels
+            enhance (bool): Whether to enhance the images
+            max_concurrency (int): Maximum number of in-flight requests
+
+        Returns:
+            List[str]: Success message per prompt, in input order
+        """
+        return asyncio.run(self.generate_images_async(
+            prompts, model, image_paths, width, height, enhance, max_concurrency
+        ))
+
 class PollinationsAI:
     """Main class for interacting with Pollinations AI services."""
 
     def __init__(self, timeout: int = 10):
         """
         Initialize Pollinations AI client.
-        
+
+        The cloudscraper bootstrap (the expensive part of client startup)
+        runs once here and both sub-clients reuse the resulting session,
+        so construction pays a single Cloudflare handshake.
+
         Args:
             timeout (int): Request timeout in seconds. Defaults to 10.
         """
-        self.chat_client = ChatClient(timeout)
-        self.image_client = ImageClient(timeout)
+        scraper = BaseClient._get_scraper()
+        self.chat_client = ChatClient(timeout, scraper)
+        self.image_client = ImageClient(timeout, scraper)
 
     def chat(self, prompt: str, system_prompt: str = "You are a helpful assistant.") -> str:
         """Wrapper for ChatClient.chat()"""
@@ -262,6 +862,35 @@ class PollinationsAI:
         """Wrapper for ImageClient.generate_image()"""
         return self.image_client.generate_image(prompt, model, image_path, width, height, enhance)
 
+    async def chat_async(self, prompt: str, system_prompt: str = "You are a helpful assistant.") -> str:
+        """Wrapper for ChatClient.chat_async()"""
+        return await self.chat_client.chat_async(prompt, system_prompt)
+
+    async def generate_image_async(
+        self,
+        prompt: str,
+        model: ModelType = ModelType.FLUX_3D,
+        image_path: str = "image.png",
+        width: int = 1024,
+        height: int = 1024,
+        enhance: bool = True
+    ) -> str:
+        """Wrapper for ImageClient.generate_image_async()"""
+        return await self.image_client.generate_image_async(prompt, model, image_path, width, height, enhance)
+
+    def generate_images(
+        self,
+        prompts: List[str],
+        model: ModelType = ModelType.FLUX_3D,
+        image_paths: Optional[List[str]] = None,
+        width: int = 1024,
+        height: int = 1024,
+        enhance: bool = True,
+        max_concurrency: int = 4
+    ) -> List[str]:
+        """Wrapper for ImageClient.generate_images()"""
+        return self.image_client.generate_images(prompts, model, image_paths, width, height, enhance, max_concurrency)
+
 # Example usage
 if __name__ == "__main__":
     client = PollinationsAI()